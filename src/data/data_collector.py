@@ -6,10 +6,11 @@
 
 import yfinance as yf
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 import os
 import time
+from typing import Dict, Optional
 
 # 로깅 설정
 logging.basicConfig(
@@ -65,6 +66,41 @@ class StockDataCollector:
         # 종목 정보 캐시 초기화
         self.info_cache = {}
     
+    def get_data_path(self, symbol: str) -> str:
+        """
+        오늘 날짜의 로컬 데이터 파일 경로
+        
+        Args:
+            symbol (str): 주식 심볼
+        
+        Returns:
+            str: 데이터 파일 경로 (예: data/market_data/NVDA_1d_20250523.csv)
+        """
+        today_str = datetime.now().strftime('%Y%m%d')
+        filename = f"{symbol}_1d_{today_str}.csv"
+        return os.path.join(self.data_dir, filename)
+    
+    def get_data_version(self, symbol: str) -> Optional[Dict]:
+        """
+        로컬 데이터 파일의 버전 정보 조회
+        데이터 파일이 갱신되면 버전이 바뀌므로, 이를 기준으로 캐시된 응답의 유효성을 판단합니다.
+        
+        Args:
+            symbol (str): 주식 심볼
+        
+        Returns:
+            Optional[Dict]: 버전 문자열(version)과 수정 시각(modified, UTC), 파일이 없으면 None
+        """
+        filepath = self.get_data_path(symbol)
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return {
+            'version': f"{os.path.basename(filepath)}:{stat.st_mtime_ns}:{stat.st_size}",
+            'modified': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+        }
+    
     def get_latest_data(self, symbol: str, period: str = '1y') -> pd.DataFrame:
         """
         최신 주가 데이터 수집 또는 로드
@@ -77,10 +113,8 @@ class StockDataCollector:
         Returns:
             pd.DataFrame: 주가 데이터
         """
-        # 로컬 파일 경로 설정 (예: data/market_data/NVDA_1d_20250523.csv)
-        today_str = datetime.now().strftime('%Y%m%d')
-        filename = f"{symbol}_1d_{today_str}.csv"
-        filepath = os.path.join(self.data_dir, filename)
+        # 로컬 파일 경로 설정
+        filepath = self.get_data_path(symbol)
 
         # 로컬 파일에서 데이터 로드 시도
         if os.path.exists(filepath):
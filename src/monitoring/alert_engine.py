@@ -0,0 +1,186 @@
+"""
+매매 신호 변경 알림 엔진
+
+이 모듈은 데이터 갱신 후 종목별 최신 매매 신호를 이전 상태와 비교하여,
+신호가 바뀐 종목만 묶음(batch) 알림으로 전송합니다.
+동작 방식:
+1. 종목 x 지표 형태의 최신 신호 행렬 입력 (1: 매수, -1: 매도, 0: 중립)
+   - 행렬은 대시보드의 스냅샷 갱신(refresh_snapshots)에서 지표 계산과 함께 생성
+2. 디스크에 저장된 이전 신호 행렬과 벡터 연산으로 비교하여 변경된 종목만 추출
+   - 이전 상태가 없는 종목/지표는 기준값으로만 저장하고 알림을 보내지 않음
+3. 변경 사항을 batch_size 종목 단위의 메시지로 묶고, 속도 제한기를 거쳐 싱크로 전송
+   - 싱크에 메시지 길이 제한(max_message_length)이 있으면 제한을 넘지 않도록 묶음을 더 나눔
+4. 전송에 실패한 종목은 이전 상태를 유지하여 다음 실행 시 다시 알림
+5. 최신 신호 행렬을 디스크에 저장
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.monitoring.notifiers import AlertSink, RateLimiter, create_default_sink
+from src.strategy.technical_indicators import TechnicalIndicators
+
+logger = logging.getLogger(__name__)
+
+SIGNAL_NAMES = {1: 'BUY', -1: 'SELL', 0: 'NEUTRAL'}
+
+
+def latest_signals(indicators: TechnicalIndicators) -> Dict[str, int]:
+    """
+    최신 시점의 지표별 매매 신호
+
+    Args:
+        indicators (TechnicalIndicators): 지표 계산이 끝난 객체
+
+    Returns:
+        Dict[str, int]: 지표별 신호 (1: 매수, -1: 매도, 0: 중립)
+    """
+    return {k: int(v.iloc[-1]) for k, v in indicators.get_signals().items()}
+
+
+class SignalAlertEngine:
+    def __init__(self, alert_dir: Optional[str] = None, sink: Optional[AlertSink] = None,
+                 batch_size: int = 50, rate_limiter: Optional[RateLimiter] = None):
+        """
+        매매 신호 변경 알림 엔진
+
+        Args:
+            alert_dir (Optional[str]): 신호 상태와 알림 기록 저장 디렉토리 (기본값: data/alerts)
+            sink (Optional[AlertSink]): 알림 싱크 (기본값: create_default_sink)
+            batch_size (int): 알림 메시지 하나에 담을 최대 종목 수
+            rate_limiter (Optional[RateLimiter]): 전송 속도 제한기 (기본값: 1분당 20건)
+        """
+        if alert_dir is None:
+            alert_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'alerts')
+        self.alert_dir = alert_dir
+        os.makedirs(self.alert_dir, exist_ok=True)
+        self.state_path = os.path.join(self.alert_dir, 'signal_state.csv')
+
+        self.sink = sink or create_default_sink(self.alert_dir)
+        self.batch_size = batch_size
+        self.rate_limiter = rate_limiter or RateLimiter(max_calls=20, period=60)
+
+    def load_state(self) -> pd.DataFrame:
+        """디스크에 저장된 이전 신호 행렬 로드"""
+        if not os.path.exists(self.state_path):
+            return pd.DataFrame()
+        try:
+            return pd.read_csv(self.state_path, index_col=0)
+        except Exception as e:
+            logger.error(f"Error loading signal state from {self.state_path}: {str(e)}")
+            return pd.DataFrame()
+
+    def save_state(self, state: pd.DataFrame):
+        """신호 행렬을 디스크에 저장 (임시 파일에 쓴 후 교체)"""
+        tmp_path = self.state_path + '.tmp'
+        state.to_csv(tmp_path)
+        os.replace(tmp_path, self.state_path)
+
+    def find_changes(self, previous: pd.DataFrame, current: pd.DataFrame) -> List[Dict]:
+        """
+        이전/최신 신호 행렬 비교
+
+        Args:
+            previous (pd.DataFrame): 이전 신호 행렬
+            current (pd.DataFrame): 최신 신호 행렬
+
+        Returns:
+            List[Dict]: 변경 목록 (symbol, indicator, previous, current)
+        """
+        if previous.empty or current.empty:
+            return []
+        aligned = previous.reindex(index=current.index, columns=current.columns)
+        changed = (aligned.notna() & aligned.ne(current)).to_numpy()
+        rows, cols = np.nonzero(changed)
+        prev_values = aligned.to_numpy()
+        curr_values = current.to_numpy()
+        return [
+            {
+                'symbol': current.index[i],
+                'indicator': current.columns[j],
+                'previous': int(prev_values[i, j]),
+                'current': int(curr_values[i, j])
+            }
+            for i, j in zip(rows, cols)
+        ]
+
+    def _format_header(self, n_symbols: int) -> str:
+        return f"[Signal Alert] {n_symbols} symbols changed"
+
+    def _format_change(self, change: Dict) -> str:
+        return (f"{change['symbol']} {change['indicator']}: "
+                f"{SIGNAL_NAMES.get(change['previous'])} -> {SIGNAL_NAMES.get(change['current'])}")
+
+    def format_message(self, changes: List[Dict]) -> str:
+        """변경 목록을 알림 메시지로 변환 (싱크의 메시지 길이 제한을 넘으면 잘라냄)"""
+        symbols = {change['symbol'] for change in changes}
+        lines = [self._format_header(len(symbols))]
+        lines.extend(self._format_change(change) for change in changes)
+        message = '\n'.join(lines)
+        limit = self.sink.max_message_length
+        if limit is not None and len(message) > limit:
+            message = message[:limit - 3] + '...'
+        return message
+
+    def make_batches(self, changes: List[Dict]) -> List[List[Dict]]:
+        """
+        변경 목록을 batch_size 종목 단위로 묶음 (같은 종목의 변경은 같은 묶음에 포함)
+        싱크에 메시지 길이 제한이 있으면 메시지가 제한을 넘기 전에 새 묶음을 시작합니다.
+        """
+        by_symbol: Dict[str, List[Dict]] = {}
+        for change in changes:
+            by_symbol.setdefault(change['symbol'], []).append(change)
+
+        limit = self.sink.max_message_length
+        batches: List[List[Dict]] = []
+        batch: List[Dict] = []
+        n_symbols = 0
+        body_length = 0
+        for symbol_changes in by_symbol.values():
+            # 줄바꿈을 포함한 이 종목의 변경 줄 길이
+            length = sum(len(self._format_change(change)) + 1 for change in symbol_changes)
+            too_long = (limit is not None and n_symbols > 0
+                        and len(self._format_header(n_symbols + 1)) + body_length + length > limit)
+            if n_symbols == self.batch_size or too_long:
+                batches.append(batch)
+                batch, n_symbols, body_length = [], 0, 0
+            batch.extend(symbol_changes)
+            n_symbols += 1
+            body_length += length
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def process(self, current: pd.DataFrame) -> List[Dict]:
+        """
+        최신 신호 행렬을 처리하여 변경 알림 전송 및 상태 저장
+
+        Args:
+            current (pd.DataFrame): 최신 신호 행렬 (종목 x 지표)
+
+        Returns:
+            List[Dict]: 전송에 성공한 변경 목록
+        """
+        previous = self.load_state()
+        changes = self.find_changes(previous, current)
+        logger.info(f"Signal check: {len(current)} symbols, {len(changes)} changes")
+
+        sent: List[Dict] = []
+        failed_symbols = set()
+        for batch in self.make_batches(changes):
+            try:
+                self.rate_limiter.acquire()
+                self.sink.send(self.format_message(batch), batch)
+                sent.extend(batch)
+            except Exception as e:
+                logger.error(f"Error sending signal alert: {str(e)}")
+                failed_symbols.update(change['symbol'] for change in batch)
+
+        # 전송 실패 종목은 이전 상태를 유지하여 다음 실행 시 다시 감지되도록 함
+        state = current.drop(index=list(failed_symbols)).combine_first(previous)
+        self.save_state(state)
+        return sent
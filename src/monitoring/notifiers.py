@@ -0,0 +1,157 @@
+"""
+알림 전송 모듈
+
+이 모듈은 알림 엔진이 생성한 메시지를 외부로 전송하는 싱크(Sink)와 전송 속도 제한기를 제공합니다.
+주요 기능:
+1. AlertSink: 알림 싱크 기본 클래스 (send 메서드를 구현하여 새 전송 방식 추가)
+2. FileAlertSink: 로컬 파일(JSON Lines)에 알림 기록 (오프라인 테스트용)
+3. HttpAlertSink: HTTP 웹훅으로 알림 전송 (로컬 스텁 서버로 테스트 가능)
+4. TelegramAlertSink: 텔레그램 봇으로 알림 전송
+5. RateLimiter: 일정 시간당 최대 전송 횟수 제한 (토큰 버킷 방식)
+"""
+
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class AlertSink(ABC):
+    """알림 싱크 기본 클래스"""
+
+    # 메시지 하나의 최대 길이 (None이면 제한 없음, 알림 엔진이 이 길이에 맞춰 메시지를 나눔)
+    max_message_length: Optional[int] = None
+
+    @abstractmethod
+    def send(self, message: str, changes: List[Dict]):
+        """
+        알림 전송
+
+        Args:
+            message (str): 사람이 읽을 수 있는 알림 메시지
+            changes (List[Dict]): 알림에 포함된 신호 변경 목록
+        """
+
+
+class FileAlertSink(AlertSink):
+    def __init__(self, path: str):
+        """
+        로컬 파일 알림 싱크 (알림 한 건당 JSON 한 줄 기록)
+
+        Args:
+            path (str): 알림 기록 파일 경로
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def send(self, message: str, changes: List[Dict]):
+        record = {
+            'sent_at': datetime.now().isoformat(),
+            'message': message,
+            'changes': changes
+        }
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+class HttpAlertSink(AlertSink):
+    def __init__(self, url: str, timeout: float = 10.0):
+        """
+        HTTP 웹훅 알림 싱크
+
+        Args:
+            url (str): 알림을 POST할 URL
+            timeout (float): 요청 타임아웃(초)
+        """
+        self.url = url
+        self.timeout = timeout
+
+    def build_payload(self, message: str, changes: List[Dict]) -> Dict:
+        """요청 본문(JSON) 생성"""
+        return {'message': message, 'changes': changes}
+
+    def send(self, message: str, changes: List[Dict]):
+        response = requests.post(self.url, json=self.build_payload(message, changes), timeout=self.timeout)
+        response.raise_for_status()
+
+
+class TelegramAlertSink(HttpAlertSink):
+    # 텔레그램 sendMessage API의 text 최대 길이
+    max_message_length = 4096
+
+    def __init__(self, token: str, chat_id: str, timeout: float = 10.0):
+        """
+        텔레그램 봇 알림 싱크
+
+        Args:
+            token (str): 텔레그램 봇 토큰
+            chat_id (str): 알림을 받을 채팅 ID
+            timeout (float): 요청 타임아웃(초)
+        """
+        super().__init__(f"https://api.telegram.org/bot{token}/sendMessage", timeout)
+        self.chat_id = chat_id
+
+    def build_payload(self, message: str, changes: List[Dict]) -> Dict:
+        return {'chat_id': self.chat_id, 'text': message}
+
+
+class RateLimiter:
+    def __init__(self, max_calls: int, period: float,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        토큰 버킷 방식 전송 속도 제한기
+
+        Args:
+            max_calls (int): period 동안 허용되는 최대 호출 수
+            period (float): 기준 시간(초)
+            clock (Callable): 현재 시각 함수 (테스트 시 교체 가능)
+            sleep (Callable): 대기 함수 (테스트 시 교체 가능)
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(max_calls)
+        self.updated_at = clock()
+
+    def _refill(self):
+        now = self.clock()
+        elapsed = now - self.updated_at
+        self.tokens = min(self.max_calls, self.tokens + elapsed * self.max_calls / self.period)
+        self.updated_at = now
+
+    def acquire(self):
+        """전송 가능할 때까지 대기한 후 토큰 1개 사용"""
+        self._refill()
+        while self.tokens < 1:
+            wait = (1 - self.tokens) * self.period / self.max_calls
+            logger.info(f"Rate limit reached, waiting {wait:.2f}s")
+            self.sleep(wait)
+            self._refill()
+        self.tokens -= 1
+
+
+def create_default_sink(alert_dir: str) -> AlertSink:
+    """
+    기본 알림 싱크 생성
+    TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID 환경 변수가 있으면 텔레그램, 없으면 로컬 파일 싱크를 사용합니다.
+
+    Args:
+        alert_dir (str): 로컬 파일 싱크의 저장 디렉토리
+
+    Returns:
+        AlertSink: 알림 싱크
+    """
+    token: Optional[str] = os.environ.get('TELEGRAM_BOT_TOKEN')
+    chat_id: Optional[str] = os.environ.get('TELEGRAM_CHAT_ID')
+    if token and chat_id:
+        return TelegramAlertSink(token, chat_id)
+    return FileAlertSink(os.path.join(alert_dir, 'alerts.jsonl'))
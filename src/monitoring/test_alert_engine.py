@@ -0,0 +1,163 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.monitoring.alert_engine import SignalAlertEngine
+from src.monitoring.notifiers import AlertSink, FileAlertSink, RateLimiter
+
+N_SYMBOLS = 5000
+BATCH_SIZE = 100
+
+
+class FakeClock:
+    """RateLimiter용 가짜 시계 (sleep 호출 시 시간만 진행)"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FailingSink(AlertSink):
+    def send(self, message, changes):
+        raise ConnectionError('sink unavailable')
+
+
+def make_signal_matrix(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    symbols = [f"SYM{i:05d}" for i in range(N_SYMBOLS)]
+    return pd.DataFrame(rng.integers(-1, 2, size=(N_SYMBOLS, 3)),
+                        index=symbols, columns=['RSI', 'MACD', 'BB'])
+
+
+def read_alerts(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_engine(alert_dir, sink, clock):
+    limiter = RateLimiter(max_calls=5, period=60, clock=clock, sleep=clock.sleep)
+    return SignalAlertEngine(alert_dir=str(alert_dir), sink=sink, batch_size=BATCH_SIZE, rate_limiter=limiter)
+
+
+def test_alert_sink_is_abstract():
+    with pytest.raises(TypeError):
+        AlertSink()
+
+
+def test_first_run_only_records_baseline(tmp_path, clock):
+    alerts_path = tmp_path / 'alerts.jsonl'
+    engine = make_engine(tmp_path, FileAlertSink(str(alerts_path)), clock)
+    current = make_signal_matrix(0)
+
+    assert engine.process(current) == []
+    assert read_alerts(alerts_path) == []
+    pd.testing.assert_frame_equal(engine.load_state().astype(int), current)
+
+
+def test_changed_symbols_are_batched_and_rate_limited(tmp_path, clock):
+    alerts_path = tmp_path / 'alerts.jsonl'
+    engine = make_engine(tmp_path, FileAlertSink(str(alerts_path)), clock)
+    previous = make_signal_matrix(0)
+    engine.process(previous)
+
+    # 1,234개 종목의 RSI 신호 변경 (나머지는 그대로)
+    current = previous.copy()
+    changed = current.index[:1234]
+    current.loc[changed, 'RSI'] = (current.loc[changed, 'RSI'] + 2) % 3 - 1
+    sent = engine.process(current)
+
+    assert len(sent) == 1234
+    assert {change['symbol'] for change in sent} == set(changed)
+    assert all(change['indicator'] == 'RSI' for change in sent)
+
+    alerts = read_alerts(alerts_path)
+    batch_sizes = [len({change['symbol'] for change in alert['changes']}) for alert in alerts]
+    assert batch_sizes == [BATCH_SIZE] * 12 + [34]
+    assert alerts[0]['message'].startswith(f"[Signal Alert] {BATCH_SIZE} symbols changed")
+
+    # 1분당 5건 제한: 처음 5건 이후 8건은 각각 12초씩 대기
+    assert len(clock.sleeps) == 8
+    assert sum(clock.sleeps) == pytest.approx(8 * 12)
+
+    # 상태가 갱신되어 같은 행렬을 다시 처리하면 알림 없음
+    assert engine.process(current) == []
+    assert len(read_alerts(alerts_path)) == 13
+
+
+def test_failed_send_keeps_previous_state(tmp_path, clock):
+    previous = make_signal_matrix(0)
+    current = previous.copy()
+    current.loc['SYM00007', 'MACD'] = (current.loc['SYM00007', 'MACD'] + 2) % 3 - 1
+
+    failing = make_engine(tmp_path, FailingSink(), clock)
+    failing.process(previous)
+    assert failing.process(current) == []
+    assert failing.load_state().loc['SYM00007', 'MACD'] == previous.loc['SYM00007', 'MACD']
+
+    # 다음 실행에서 같은 변경이 다시 감지되어 전송됨
+    alerts_path = tmp_path / 'alerts.jsonl'
+    engine = make_engine(tmp_path, FileAlertSink(str(alerts_path)), clock)
+    sent = engine.process(current)
+    assert sent == [{
+        'symbol': 'SYM00007',
+        'indicator': 'MACD',
+        'previous': int(previous.loc['SYM00007', 'MACD']),
+        'current': int(current.loc['SYM00007', 'MACD'])
+    }]
+    assert engine.load_state().loc['SYM00007', 'MACD'] == current.loc['SYM00007', 'MACD']
+
+
+class LimitedSink(FileAlertSink):
+    max_message_length = 200
+
+
+def test_messages_split_to_sink_length_limit(tmp_path, clock):
+    alerts_path = tmp_path / 'alerts.jsonl'
+    engine = make_engine(tmp_path, LimitedSink(str(alerts_path)), clock)
+    previous = make_signal_matrix(0)
+    engine.process(previous)
+
+    current = previous.copy()
+    changed = current.index[:30]
+    for column in ['RSI', 'MACD']:
+        current.loc[changed, column] = (current.loc[changed, column] + 2) % 3 - 1
+    sent = engine.process(current)
+
+    alerts = read_alerts(alerts_path)
+    assert len(sent) == 60
+    assert len(alerts) > 1
+    assert all(len(alert['message']) <= 200 for alert in alerts)
+    # 같은 종목의 변경은 나뉘지 않음
+    for alert in alerts:
+        symbols = {change['symbol'] for change in alert['changes']}
+        assert len(alert['changes']) == 2 * len(symbols)
+        assert alert['message'].startswith(f"[Signal Alert] {len(symbols)} symbols changed")
+
+
+def test_oversized_single_symbol_message_is_truncated(tmp_path, clock):
+    engine = make_engine(tmp_path, LimitedSink(str(tmp_path / 'alerts.jsonl')), clock)
+    changes = [{'symbol': 'S' * 300, 'indicator': 'RSI', 'previous': 0, 'current': 1}]
+    assert engine.make_batches(changes) == [changes]
+    message = engine.format_message(changes)
+    assert len(message) == 200
+    assert message.endswith('...')
@@ -0,0 +1,107 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pandas as pd
+import pytest
+import requests
+
+from src.monitoring.alert_engine import SignalAlertEngine
+from src.monitoring.notifiers import HttpAlertSink, RateLimiter, TelegramAlertSink
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """받은 요청 본문을 기록하고 server.status 코드로 응답하는 스텁 핸들러"""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append({'path': self.path, 'json': json.loads(body)})
+        self.send_response(self.server.status)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = HTTPServer(('127.0.0.1', 0), StubHandler)
+    server.requests = []
+    server.status = 200
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def stub_url(server, path: str = '/hook') -> str:
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+def make_engine(tmp_path, sink):
+    limiter = RateLimiter(max_calls=1000, period=60, sleep=lambda seconds: None)
+    return SignalAlertEngine(alert_dir=str(tmp_path), sink=sink, rate_limiter=limiter)
+
+
+def flip(matrix: pd.DataFrame, symbols, columns) -> pd.DataFrame:
+    changed = matrix.copy()
+    changed.loc[symbols, columns] = (changed.loc[symbols, columns] + 2) % 3 - 1
+    return changed
+
+
+def test_http_sink_posts_message_and_changes(stub_server):
+    changes = [{'symbol': 'NVDA', 'indicator': 'RSI', 'previous': 0, 'current': 1}]
+    HttpAlertSink(stub_url(stub_server)).send('NVDA RSI: NEUTRAL -> BUY', changes)
+
+    assert stub_server.requests == [{
+        'path': '/hook',
+        'json': {'message': 'NVDA RSI: NEUTRAL -> BUY', 'changes': changes}
+    }]
+
+
+def test_http_sink_raises_on_error_status(stub_server):
+    stub_server.status = 500
+    with pytest.raises(requests.HTTPError):
+        HttpAlertSink(stub_url(stub_server)).send('message', [])
+
+
+def test_engine_delivers_through_http_sink(tmp_path, stub_server):
+    previous = pd.DataFrame({'RSI': [0, 0], 'MACD': [1, -1]}, index=['NVDA', 'AMD'])
+    engine = make_engine(tmp_path, HttpAlertSink(stub_url(stub_server)))
+    engine.process(previous)
+
+    # 웹훅이 실패하면 상태를 유지하고, 복구된 뒤 같은 변경을 다시 전송
+    stub_server.status = 503
+    current = flip(previous, ['AMD'], ['MACD'])
+    assert engine.process(current) == []
+
+    stub_server.status = 200
+    sent = engine.process(current)
+    assert sent == [{'symbol': 'AMD', 'indicator': 'MACD', 'previous': -1, 'current': 0}]
+    assert len(stub_server.requests) == 2
+    assert stub_server.requests[-1]['json']['changes'] == sent
+
+
+def test_telegram_messages_respect_length_limit(tmp_path, stub_server):
+    sink = TelegramAlertSink('TOKEN', 'CHAT')
+    sink.url = stub_url(stub_server, '/botTOKEN/sendMessage')
+    engine = make_engine(tmp_path, sink)
+
+    symbols = [f"LONG-SYMBOL-NAME-{i:03d}.KS" for i in range(120)]
+    previous = pd.DataFrame(0, index=symbols, columns=['RSI', 'MACD', 'BB'])
+    engine.process(previous)
+    current = flip(previous, symbols, ['RSI', 'MACD', 'BB'])
+    sent = engine.process(current)
+
+    # 50종목 x 3개 지표는 4096자를 넘으므로 묶음이 더 나뉘어야 함
+    texts = [r['json']['text'] for r in stub_server.requests]
+    assert len(texts) > 3
+    assert all(len(text) <= TelegramAlertSink.max_message_length for text in texts)
+    assert all(r['json']['chat_id'] == 'CHAT' for r in stub_server.requests)
+    assert len(sent) == len(symbols) * 3
+    assert sum(len(text.split('\n')) - 1 for text in texts) == len(sent)
@@ -0,0 +1,112 @@
+"""
+재귀형 지표 커널 벤치마크
+
+분봉(1분) 기준 대용량 가상 주가 데이터로 kernels 모듈의 재귀형 지표 계산 속도를 측정합니다.
+단일 종목(대시보드에서 사용하는 1차원 입력)과 여러 종목(2차원 입력)을 각각 측정합니다.
+비교 대상:
+1. 순수 파이썬 반복문 (컴파일하지 않은 커널)
+2. 기본 설치 커널 (Numba가 없을 때 사용하는 pandas ewm / NumPy 커널)
+3. Numba 커널 (설치된 경우)
+
+실행 방법:
+    python src/strategy/benchmark_kernels.py
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from src.strategy import kernels
+import numpy as np
+import pandas as pd
+import time
+import logging
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 1년치 분봉 (하루 390분 * 252 거래일), 수집 대상 종목 수
+N_BARS = 390 * 252
+SYMBOL_COUNTS = [1, 25]
+RSI_WINDOW = 14
+
+
+def make_intraday_data(n_bars: int, n_symbols: int, seed: int = 0):
+    """랜덤 워크 기반 가상 분봉 데이터 (시점 x 종목) 생성"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, size=(n_bars, n_symbols)), axis=0))
+    spread = np.abs(rng.normal(0, 0.0005, size=(n_bars, n_symbols))) * close
+    return close + spread, close - spread, close
+
+
+def measure(func, *args, repeat: int = 3) -> float:
+    """최소 실행 시간(초) 측정"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def pandas_rolling_rsi(close: np.ndarray, window: int) -> pd.DataFrame:
+    """기존 TechnicalIndicators.calculate_rsi 방식 (단순이동평균 근사)"""
+    delta = pd.DataFrame(close).diff()
+    gain = delta.where(delta > 0, 0).rolling(window=window).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
+    return 100 - (100 / (1 + gain / loss))
+
+
+def run(n_symbols: int):
+    """종목 수별 벤치마크 실행"""
+    high, low, close = make_intraday_data(N_BARS, n_symbols)
+    logger.info(f"\n=== {N_BARS} bars x {n_symbols} symbols ===")
+
+    true_range = kernels.true_range(high, low, close)
+    atr = kernels.wilder_smooth(true_range, 10)
+    hl2 = (high + low) / 2
+
+    cases = {
+        'Wilder smoothing': (
+            (kernels._wilder_smooth_loop, kernels._wilder_smooth_fallback, kernels._wilder_smooth_kernel),
+            (true_range, RSI_WINDOW),
+        ),
+        'Parabolic SAR': (
+            (kernels._parabolic_sar_loop, kernels._parabolic_sar_fallback, kernels._parabolic_sar_kernel),
+            (high, low, 0.02, 0.2),
+        ),
+        'SuperTrend': (
+            (kernels._supertrend_loop, kernels._supertrend_fallback, kernels._supertrend_kernel),
+            (close, hl2 + 3 * atr, hl2 - 3 * atr),
+        ),
+    }
+
+    for name, ((python_kernel, fallback_kernel, active_kernel), args) in cases.items():
+        # Numba 커널은 첫 호출 시 컴파일되므로 측정 전에 한 번 실행
+        active_kernel(*args)
+        python_time = measure(python_kernel, *args, repeat=1)
+        fallback_time = measure(fallback_kernel, *args)
+        logger.info(f"{name}:")
+        logger.info(f"  pure python : {python_time:.4f}s")
+        logger.info(f"  default     : {fallback_time:.4f}s ({python_time / fallback_time:.1f}x)")
+        if kernels.NUMBA_AVAILABLE:
+            numba_time = measure(active_kernel, *args)
+            logger.info(f"  numba       : {numba_time:.4f}s ({python_time / numba_time:.1f}x)")
+
+    logger.info("RSI:")
+    logger.info(f"  pandas rolling (approximate) : {measure(pandas_rolling_rsi, close, RSI_WINDOW):.4f}s")
+    logger.info(f"  kernels.wilder_rsi           : {measure(kernels.wilder_rsi, close, RSI_WINDOW):.4f}s")
+
+
+def main():
+    logger.info(f"numba available: {kernels.NUMBA_AVAILABLE}")
+    for n_symbols in SYMBOL_COUNTS:
+        run(n_symbols)
+
+
+if __name__ == "__main__":
+    main()
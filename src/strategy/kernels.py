@@ -0,0 +1,402 @@
+"""
+재귀형 기술적 지표 계산 커널 모듈
+
+Wilder 평활(RSI, ATR, ADX), Parabolic SAR, SuperTrend처럼 이전 시점의 결과가
+다음 시점 계산에 필요한 재귀형 지표는 pandas rolling 연산으로 표현할 수 없어
+파이썬 반복문으로 구현하면 매우 느립니다. 이 모듈은 이러한 지표를 위한 계산 커널을 제공합니다.
+
+구현 방식:
+- Numba가 설치되어 있으면 시점별 반복문 커널을 JIT 컴파일하여 사용
+- Numba가 없는 경우
+  * Wilder 평활: 단순평균으로 초기값을 구한 뒤 pandas ewm(C 구현)으로 재귀 평활
+  * Parabolic SAR, SuperTrend: 종목 수가 적으면(32개 미만) 반복문 커널을 그대로 사용하고,
+    종목 수가 많으면 종목(컬럼) 방향으로 벡터화한 NumPy 구현을 사용
+- 입력은 1차원(단일 종목) 또는 2차원(시점 x 종목) 배열을 모두 지원하며,
+  입력과 같은 차원의 배열을 반환
+- 종목별로 데이터 시작 시점이 다른 경우(앞부분이 NaN) 종목마다 첫 유효값부터 계산
+- Wilder 평활에서 중간의 결측값(NaN)은 건너뛰고 직전 평활값을 유지
+
+제공 커널:
+1. wilder_smooth: Wilder 평활 (첫 값은 기간 단순평균, 이후 alpha = 1/기간 재귀 평활)
+2. wilder_rsi: Wilder 방식 RSI
+3. true_range: True Range
+4. parabolic_sar: Parabolic SAR
+5. supertrend: SuperTrend (지표값과 추세 방향)
+
+Numba 설치 (선택 사항):
+    pip install numba
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _as_2d(values) -> Tuple[np.ndarray, bool]:
+    """입력 배열을 (시점 x 종목) 2차원 float 배열로 변환"""
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim == 1:
+        return array.reshape(-1, 1), True
+    if array.ndim != 2:
+        raise ValueError(f"Expected 1D or 2D array, got {array.ndim}D")
+    return array, False
+
+
+def _restore(array: np.ndarray, is_1d: bool) -> np.ndarray:
+    """_as_2d로 변환한 결과를 원래 차원으로 복원"""
+    return array[:, 0] if is_1d else array
+
+
+def _first_valid_index(values: np.ndarray) -> np.ndarray:
+    """종목별 첫 유효값(NaN이 아닌 값) 위치 (유효값이 없으면 시점 수)"""
+    valid = ~np.isnan(values)
+    return np.where(valid.any(axis=0), valid.argmax(axis=0), values.shape[0])
+
+
+# ---------------------------------------------------------------------------
+# Numba 커널 (종목별 시점 반복문)
+# ---------------------------------------------------------------------------
+
+def _wilder_smooth_loop(values, window):
+    n, m = values.shape
+    out = np.full((n, m), np.nan)
+    for j in range(m):
+        # 처음 window개의 유효값 평균으로 초기값 계산
+        count = 0
+        total = 0.0
+        t = 0
+        while t < n and count < window:
+            if not np.isnan(values[t, j]):
+                total += values[t, j]
+                count += 1
+            t += 1
+        if count < window:
+            continue
+        state = total / window
+        seed_end = t
+        out[seed_end - 1, j] = state
+        for t in range(seed_end, n):
+            if not np.isnan(values[t, j]):
+                state += (values[t, j] - state) / window
+            out[t, j] = state
+    return out
+
+
+def _parabolic_sar_loop(high, low, step, max_step):
+    n, m = high.shape
+    out = np.full((n, m), np.nan)
+    for j in range(m):
+        start = 0
+        while start < n and (np.isnan(high[start, j]) or np.isnan(low[start, j])):
+            start += 1
+        if start + 1 >= n:
+            continue
+        up = high[start + 1, j] >= high[start, j]
+        sar = low[start, j] if up else high[start, j]
+        ep = high[start, j] if up else low[start, j]
+        af = step
+        out[start, j] = sar
+        for t in range(start + 1, n):
+            sar = sar + af * (ep - sar)
+            if up:
+                sar = min(sar, low[t - 1, j])
+                if t - 2 >= start:
+                    sar = min(sar, low[t - 2, j])
+                if low[t, j] < sar:
+                    up = False
+                    sar = ep
+                    ep = low[t, j]
+                    af = step
+                elif high[t, j] > ep:
+                    ep = high[t, j]
+                    af = min(af + step, max_step)
+            else:
+                sar = max(sar, high[t - 1, j])
+                if t - 2 >= start:
+                    sar = max(sar, high[t - 2, j])
+                if high[t, j] > sar:
+                    up = True
+                    sar = ep
+                    ep = high[t, j]
+                    af = step
+                elif low[t, j] < ep:
+                    ep = low[t, j]
+                    af = min(af + step, max_step)
+            out[t, j] = sar
+    return out
+
+
+def _supertrend_loop(close, basic_upper, basic_lower):
+    n, m = close.shape
+    trend = np.full((n, m), np.nan)
+    direction = np.full((n, m), np.nan)
+    for j in range(m):
+        start = 0
+        while start < n and np.isnan(basic_upper[start, j]):
+            start += 1
+        if start >= n:
+            continue
+        final_upper = basic_upper[start, j]
+        final_lower = basic_lower[start, j]
+        up = False
+        trend[start, j] = final_upper
+        direction[start, j] = -1.0
+        for t in range(start + 1, n):
+            prev_close = close[t - 1, j]
+            if basic_upper[t, j] < final_upper or prev_close > final_upper:
+                final_upper = basic_upper[t, j]
+            if basic_lower[t, j] > final_lower or prev_close < final_lower:
+                final_lower = basic_lower[t, j]
+            if up:
+                up = close[t, j] >= final_lower
+            else:
+                up = close[t, j] > final_upper
+            trend[t, j] = final_lower if up else final_upper
+            direction[t, j] = 1.0 if up else -1.0
+    return trend, direction
+
+
+# ---------------------------------------------------------------------------
+# Numba가 없을 때 사용하는 커널 (pandas ewm, 종목 방향 벡터화)
+# ---------------------------------------------------------------------------
+
+def _wilder_smooth_numpy(values, window):
+    n, m = values.shape
+    # 종목별로 처음 window개의 유효값 평균을 초기값 위치에 넣고, 그 이전 구간은 NaN 처리
+    seeded = np.full((n, m), np.nan)
+    for j in range(m):
+        valid = np.flatnonzero(~np.isnan(values[:, j]))
+        if len(valid) < window:
+            continue
+        seed_index = valid[window - 1]
+        seeded[seed_index, j] = values[valid[:window], j].mean()
+        seeded[seed_index + 1:, j] = values[seed_index + 1:, j]
+    # 초기값 이후는 alpha = 1/window 재귀 평활 (중간 NaN은 건너뛰고 직전 값 유지)
+    return pd.DataFrame(seeded).ewm(alpha=1.0 / window, adjust=False, ignore_na=True).mean().to_numpy()
+
+
+def _parabolic_sar_numpy(high, low, step, max_step):
+    n, m = high.shape
+    out = np.full((n, m), np.nan)
+    start = np.minimum(_first_valid_index(high), _first_valid_index(low))
+    up = np.zeros(m, dtype=bool)
+    sar = np.full(m, np.nan)
+    ep = np.full(m, np.nan)
+    af = np.full(m, step)
+    for t in range(n):
+        init = (start == t) & (t + 1 < n)
+        if init.any():
+            up[init] = high[t + 1, init] >= high[t, init]
+            sar[init] = np.where(up[init], low[t, init], high[t, init])
+            ep[init] = np.where(up[init], high[t, init], low[t, init])
+            af[init] = step
+            out[t, init] = sar[init]
+        active = start < t
+        if not active.any():
+            continue
+
+        new_sar = sar + af * (ep - sar)
+        prev_low = low[t - 1]
+        prev_high = high[t - 1]
+        if t >= 2:
+            has_two = start <= t - 2
+            prev_low = np.where(has_two, np.fmin(prev_low, low[t - 2]), prev_low)
+            prev_high = np.where(has_two, np.fmax(prev_high, high[t - 2]), prev_high)
+        new_sar = np.where(up, np.minimum(new_sar, prev_low), np.maximum(new_sar, prev_high))
+
+        reverse = np.where(up, low[t] < new_sar, high[t] > new_sar)
+        extend = ~reverse & np.where(up, high[t] > ep, low[t] < ep)
+
+        new_sar = np.where(reverse, ep, new_sar)
+        new_ep = np.where(reverse | extend, np.where(up ^ reverse, high[t], low[t]), ep)
+        new_af = np.where(reverse, step, np.where(extend, np.minimum(af + step, max_step), af))
+
+        sar[active] = new_sar[active]
+        ep[active] = new_ep[active]
+        af[active] = new_af[active]
+        up[active] = (up ^ reverse)[active]
+        out[t, active] = sar[active]
+    return out
+
+
+def _supertrend_numpy(close, basic_upper, basic_lower):
+    n, m = close.shape
+    trend = np.full((n, m), np.nan)
+    direction = np.full((n, m), np.nan)
+    start = _first_valid_index(basic_upper)
+    final_upper = np.full(m, np.nan)
+    final_lower = np.full(m, np.nan)
+    up = np.zeros(m, dtype=bool)
+    for t in range(n):
+        init = start == t
+        if init.any():
+            final_upper[init] = basic_upper[t, init]
+            final_lower[init] = basic_lower[t, init]
+            up[init] = False
+            trend[t, init] = final_upper[init]
+            direction[t, init] = -1.0
+        active = start < t
+        if not active.any():
+            continue
+
+        prev_close = close[t - 1]
+        new_upper = np.where((basic_upper[t] < final_upper) | (prev_close > final_upper),
+                             basic_upper[t], final_upper)
+        new_lower = np.where((basic_lower[t] > final_lower) | (prev_close < final_lower),
+                             basic_lower[t], final_lower)
+        new_up = np.where(up, close[t] >= new_lower, close[t] > new_upper)
+
+        final_upper[active] = new_upper[active]
+        final_lower[active] = new_lower[active]
+        up[active] = new_up[active]
+        trend[t, active] = np.where(up, final_lower, final_upper)[active]
+        direction[t, active] = np.where(up, 1.0, -1.0)[active]
+    return trend, direction
+
+
+# 종목 방향 벡터화 커널이 반복문 커널보다 빨라지는 종목 수 (시점당 NumPy 호출 비용 때문)
+VECTORIZE_MIN_COLUMNS = 32
+
+
+def _by_column_count(loop_kernel, numpy_kernel):
+    """종목 수가 적으면 반복문 커널, 많으면 종목 방향 벡터화 커널을 사용하는 커널 생성"""
+    def kernel(first, *args):
+        if first.shape[1] < VECTORIZE_MIN_COLUMNS:
+            return loop_kernel(first, *args)
+        return numpy_kernel(first, *args)
+    return kernel
+
+
+# Numba가 없을 때 사용하는 커널
+_wilder_smooth_fallback = _wilder_smooth_numpy
+_parabolic_sar_fallback = _by_column_count(_parabolic_sar_loop, _parabolic_sar_numpy)
+_supertrend_fallback = _by_column_count(_supertrend_loop, _supertrend_numpy)
+
+if NUMBA_AVAILABLE:
+    _wilder_smooth_kernel = njit(cache=True)(_wilder_smooth_loop)
+    _parabolic_sar_kernel = njit(cache=True)(_parabolic_sar_loop)
+    _supertrend_kernel = njit(cache=True)(_supertrend_loop)
+else:
+    _wilder_smooth_kernel = _wilder_smooth_fallback
+    _parabolic_sar_kernel = _parabolic_sar_fallback
+    _supertrend_kernel = _supertrend_fallback
+
+
+# ---------------------------------------------------------------------------
+# 공개 함수
+# ---------------------------------------------------------------------------
+
+def wilder_smooth(values, window: int) -> np.ndarray:
+    """
+    Wilder 평활 계산
+    처음 window개의 유효값 평균을 초기값으로 하고, 이후 alpha = 1/window로 재귀 평활합니다.
+    중간의 결측값(NaN)은 건너뛰며, 해당 시점에는 직전 평활값을 그대로 반환합니다.
+
+    Args:
+        values: 1차원 또는 2차원(시점 x 종목) 배열
+        window (int): 평활 기간
+
+    Returns:
+        np.ndarray: 평활값 (기간을 채우기 전 구간은 NaN)
+    """
+    array, is_1d = _as_2d(values)
+    return _restore(_wilder_smooth_kernel(array, window), is_1d)
+
+
+def wilder_rsi(close, window: int = 14) -> np.ndarray:
+    """
+    Wilder 방식 RSI 계산
+    결측 종가가 있으면 그 전후의 가격 변화는 건너뛰고 직전 RSI를 유지합니다.
+
+    Args:
+        close: 종가 (1차원 또는 2차원 배열)
+        window (int): RSI 계산 기간
+
+    Returns:
+        np.ndarray: RSI 값
+    """
+    array, is_1d = _as_2d(close)
+    delta = np.full_like(array, np.nan)
+    delta[1:] = array[1:] - array[:-1]
+    gain = np.where(np.isnan(delta), np.nan, np.maximum(delta, 0.0))
+    loss = np.where(np.isnan(delta), np.nan, np.maximum(-delta, 0.0))
+
+    avg_gain = _wilder_smooth_kernel(gain, window)
+    avg_loss = _wilder_smooth_kernel(loss, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100 * avg_gain / (avg_gain + avg_loss)
+    return _restore(rsi, is_1d)
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """
+    True Range 계산
+
+    Args:
+        high, low, close: 고가, 저가, 종가 (1차원 또는 2차원 배열)
+
+    Returns:
+        np.ndarray: True Range (첫 시점은 고가 - 저가)
+    """
+    high, is_1d = _as_2d(high)
+    low, _ = _as_2d(low)
+    close, _ = _as_2d(close)
+    prev_close = np.full_like(close, np.nan)
+    prev_close[1:] = close[:-1]
+    result = high - low
+    result = np.fmax(result, np.abs(high - prev_close))
+    result = np.fmax(result, np.abs(low - prev_close))
+    return _restore(result, is_1d)
+
+
+def parabolic_sar(high, low, step: float = 0.02, max_step: float = 0.2) -> np.ndarray:
+    """
+    Parabolic SAR 계산
+
+    Args:
+        high, low: 고가, 저가 (1차원 또는 2차원 배열)
+        step (float): 가속 계수 증가폭
+        max_step (float): 가속 계수 최대값
+
+    Returns:
+        np.ndarray: SAR 값 (중간에 결측값이 없는 데이터를 가정)
+    """
+    high, is_1d = _as_2d(high)
+    low, _ = _as_2d(low)
+    return _restore(_parabolic_sar_kernel(high, low, step, max_step), is_1d)
+
+
+def supertrend(high, low, close, window: int = 10, multiplier: float = 3.0,
+               atr: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    SuperTrend 계산
+
+    Args:
+        high, low, close: 고가, 저가, 종가 (1차원 또는 2차원 배열)
+        window (int): ATR 계산 기간
+        multiplier (float): ATR 승수
+        atr (Optional[np.ndarray]): 미리 계산된 ATR (없으면 Wilder 평활로 계산)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: SuperTrend 값, 추세 방향 (1: 상승, -1: 하락)
+                                       (중간에 결측값이 없는 데이터를 가정)
+    """
+    high, is_1d = _as_2d(high)
+    low, _ = _as_2d(low)
+    close, _ = _as_2d(close)
+    if atr is None:
+        atr = _wilder_smooth_kernel(true_range(high, low, close), window)
+    else:
+        atr, _ = _as_2d(atr)
+
+    hl2 = (high + low) / 2
+    basic_upper = hl2 + multiplier * atr
+    basic_lower = hl2 - multiplier * atr
+    trend, direction = _supertrend_kernel(close, basic_upper, basic_lower)
+    return _restore(trend, is_1d), _restore(direction, is_1d)
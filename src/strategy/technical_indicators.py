@@ -4,10 +4,12 @@
 이 모듈은 주가 데이터를 분석하여 다양한 기술적 지표를 계산하고, 이를 기반으로 매매 신호를 생성합니다.
 주요 기능:
 1. 이동평균선 (SMA, EMA) 계산
-2. RSI (상대강도지수) 계산
+2. RSI (상대강도지수) 계산 (단순이동평균 방식, Wilder 평활 방식)
 3. MACD (이동평균수렴확산지수) 계산
 4. 볼린저 밴드 계산
 5. 매매 신호 생성
+6. 거래량/가격 범위 기반 지표 (ATR, OBV, VWAP, 스토캐스틱, ADX, MFI)
+   - volume_indicators 모듈의 플러그인으로 구현되며, get_indicator()로 요청 시 계산 후 캐시
 
 각 지표에 대한 상세 설명:
 
@@ -31,6 +33,8 @@
      * 30 이하: 과매도 구간 (매수 고려)
      * 50을 기준으로 상승/하락 추세 판단
    - 기본 기간: 14일
+   - RSI: 상승폭/하락폭의 단순이동평균으로 근사한 값
+   - RSI_wilder: Wilder 평활(재귀형)을 적용한 표준 RSI (kernels 모듈의 컴파일 커널 사용)
 
 3. MACD (Moving Average Convergence Divergence, 이동평균수렴확산지수)
    - 단기(12일)와 장기(26일) EMA의 차이를 이용한 지표
@@ -76,10 +80,14 @@
 - 리스크 관리와 함께 사용해야 함
 """
 
+import inspect
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 
+from src.strategy import kernels
+from src.strategy.volume_indicators import INDICATOR_REGISTRY
+
 class TechnicalIndicators:
     def __init__(self, data: pd.DataFrame):
         """
@@ -89,12 +97,16 @@ class TechnicalIndicators:
             data (pd.DataFrame): 주가 데이터 (OHLCV 형식)
         """
         self.data = data.copy()
+        # 플러그인 지표 간 공유 중간값 (True Range 등)과 계산 결과 캐시
+        self._intermediates = {}
+        self._indicator_cache = {}
         self.calculate_all_indicators()
     
     def calculate_all_indicators(self):
         """모든 기술적 지표 계산"""
         self.calculate_moving_averages()
         self.calculate_rsi()
+        self.calculate_wilder_rsi()
         self.calculate_macd()
         self.calculate_bollinger_bands()
     
@@ -123,6 +135,15 @@ class TechnicalIndicators:
         rs = gain / loss
         self.data['RSI'] = 100 - (100 / (1 + rs))
     
+    def calculate_wilder_rsi(self, window: int = 14):
+        """
+        Wilder 평활 방식 RSI 계산
+        
+        Args:
+            window (int): RSI 계산 기간
+        """
+        self.data['RSI_wilder'] = kernels.wilder_rsi(self.data['Close'].to_numpy(dtype=float), window)
+    
     def calculate_macd(self, fast: int = 12, slow: int = 26, signal: int = 9):
         """
         MACD(Moving Average Convergence Divergence) 계산
@@ -151,6 +172,55 @@ class TechnicalIndicators:
         self.data['BB_upper'] = self.data['BB_middle'] + (std * num_std)
         self.data['BB_lower'] = self.data['BB_middle'] - (std * num_std)
     
+    def get_indicator(self, name: str, **params) -> pd.DataFrame:
+        """
+        플러그인 지표 조회 (최초 요청 시 계산하여 self.data에 추가하고 캐시)
+        기본값과 다른 파라미터로 계산한 지표는 컬럼 이름에 전체 파라미터 값을 붙여 저장합니다.
+        (예: get_indicator('ATR', window=7) -> 'ATR_7', get_indicator('STOCH', d_window=5) -> 'STOCH_K_14_5')
+        
+        Args:
+            name (str): 지표 이름 (예: 'ATR', 'OBV', 'VWAP', 'STOCH', 'ADX', 'MFI')
+            **params: 지표별 계산 파라미터 (예: window=14)
+        
+        Returns:
+            pd.DataFrame: 지표값 컬럼
+        """
+        if name not in INDICATOR_REGISTRY:
+            raise ValueError(f"Unknown indicator: {name}")
+        func = INDICATOR_REGISTRY[name]
+        
+        # 기본값과 같은 파라미터는 제외하여 같은 계산이 하나의 캐시 항목을 사용하도록 함
+        signature = inspect.signature(func)
+        custom = {}
+        for param_name, value in params.items():
+            if param_name not in signature.parameters:
+                raise ValueError(f"Unknown parameter for {name}: {param_name}")
+            if value != signature.parameters[param_name].default:
+                custom[param_name] = value
+        
+        key = (name, tuple(sorted(custom.items())))
+        if key not in self._indicator_cache:
+            columns = func(self.data, self._intermediates, **custom)
+            if custom:
+                # 서로 다른 파라미터 조합이 같은 컬럼을 쓰지 않도록 (data, cache를 제외한) 전체 파라미터 값을 순서대로 붙임
+                suffix = '_'.join(str(custom.get(p, param.default))
+                                  for p, param in list(signature.parameters.items())[2:])
+                columns = {f"{column}_{suffix}": values for column, values in columns.items()}
+            for column, values in columns.items():
+                self.data[column] = values
+            self._indicator_cache[key] = pd.DataFrame(columns, index=self.data.index)
+        return self._indicator_cache[key]
+    
+    def calculate_volume_indicators(self, names: Optional[List[str]] = None):
+        """
+        거래량/가격 범위 기반 플러그인 지표 일괄 계산
+        
+        Args:
+            names (Optional[List[str]]): 계산할 지표 이름 리스트 (기본값: 등록된 모든 지표)
+        """
+        for name in (names or list(INDICATOR_REGISTRY)):
+            self.get_indicator(name)
+    
     def get_signals(self) -> Dict[str, pd.Series]:
         """
         매매 신호 생성
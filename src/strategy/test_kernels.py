@@ -0,0 +1,138 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import numpy as np
+import pytest
+
+from src.strategy import kernels
+
+KERNELS = {
+    'wilder_smooth': (kernels._wilder_smooth_loop, kernels._wilder_smooth_numpy, kernels._wilder_smooth_kernel),
+    'parabolic_sar': (kernels._parabolic_sar_loop, kernels._parabolic_sar_numpy, kernels._parabolic_sar_kernel),
+    'supertrend': (kernels._supertrend_loop, kernels._supertrend_numpy, kernels._supertrend_kernel),
+}
+
+
+@pytest.fixture
+def staggered_ohlc():
+    """종목별로 데이터 시작 시점이 다른 (시점 x 종목) 가상 주가"""
+    rng = np.random.default_rng(42)
+    n, m = 300, 5
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(n, m)), axis=0))
+    spread = np.abs(rng.normal(0, 0.005, size=(n, m))) * close
+    high, low = close + spread, close - spread
+    for j, start in enumerate([0, 1, 7, 40, 299]):
+        high[:start, j] = low[:start, j] = close[:start, j] = np.nan
+    return high, low, close
+
+
+def kernel_args(name, high, low, close):
+    if name == 'wilder_smooth':
+        return (kernels.true_range(high, low, close), 14)
+    if name == 'parabolic_sar':
+        return (high, low, 0.02, 0.2)
+    atr = kernels._wilder_smooth_loop(kernels.true_range(high, low, close), 10)
+    hl2 = (high + low) / 2
+    return (close, hl2 + 3 * atr, hl2 - 3 * atr)
+
+
+def as_tuple(result):
+    return result if isinstance(result, tuple) else (result,)
+
+
+@pytest.mark.parametrize('name', list(KERNELS))
+def test_loop_and_numpy_kernels_match(name, staggered_ohlc):
+    loop_kernel, numpy_kernel, _ = KERNELS[name]
+    args = kernel_args(name, *staggered_ohlc)
+    for expected, actual in zip(as_tuple(loop_kernel(*args)), as_tuple(numpy_kernel(*args))):
+        np.testing.assert_allclose(actual, expected, rtol=1e-10, equal_nan=True)
+
+
+@pytest.mark.parametrize('n_symbols', [1, kernels.VECTORIZE_MIN_COLUMNS])
+def test_fallback_kernels_match_loop(n_symbols):
+    rng = np.random.default_rng(7)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(200, n_symbols)), axis=0))
+    high, low = close * 1.01, close * 0.99
+    fallbacks = {
+        'wilder_smooth': kernels._wilder_smooth_fallback,
+        'parabolic_sar': kernels._parabolic_sar_fallback,
+        'supertrend': kernels._supertrend_fallback,
+    }
+    for name, fallback in fallbacks.items():
+        args = kernel_args(name, high, low, close)
+        for expected, actual in zip(as_tuple(KERNELS[name][0](*args)), as_tuple(fallback(*args))):
+            np.testing.assert_allclose(actual, expected, rtol=1e-10, equal_nan=True)
+
+
+@pytest.mark.skipif(not kernels.NUMBA_AVAILABLE, reason='numba is not installed')
+@pytest.mark.parametrize('name', list(KERNELS))
+def test_numba_kernels_match_loop(name, staggered_ohlc):
+    loop_kernel, _, numba_kernel = KERNELS[name]
+    args = kernel_args(name, *staggered_ohlc)
+    for expected, actual in zip(as_tuple(loop_kernel(*args)), as_tuple(numba_kernel(*args))):
+        np.testing.assert_allclose(actual, expected, rtol=1e-10, equal_nan=True)
+
+
+def reference_wilder_rsi(close, window):
+    """Wilder RSI 참조 구현"""
+    gains = [max(close[i] - close[i - 1], 0.0) for i in range(1, len(close))]
+    losses = [max(close[i - 1] - close[i], 0.0) for i in range(1, len(close))]
+    rsi = [np.nan] * len(close)
+    avg_gain = sum(gains[:window]) / window
+    avg_loss = sum(losses[:window]) / window
+    rsi[window] = 100 - 100 / (1 + avg_gain / avg_loss)
+    for i in range(window, len(gains)):
+        avg_gain = (avg_gain * (window - 1) + gains[i]) / window
+        avg_loss = (avg_loss * (window - 1) + losses[i]) / window
+        rsi[i + 1] = 100 - 100 / (1 + avg_gain / avg_loss)
+    return np.array(rsi)
+
+
+def test_wilder_rsi_matches_reference():
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, size=200))
+    np.testing.assert_allclose(kernels.wilder_rsi(close, 14), reference_wilder_rsi(list(close), 14),
+                               rtol=1e-10, equal_nan=True)
+
+
+def test_wilder_rsi_skips_missing_bar():
+    rng = np.random.default_rng(1)
+    close = 100 + np.cumsum(rng.normal(0, 1, size=100))
+    close[50] = np.nan
+    rsi = kernels.wilder_rsi(close, 14)
+    assert not np.isnan(rsi[14:]).any()
+    # 결측 시점에는 직전 RSI 유지
+    assert rsi[50] == rsi[49]
+
+
+def test_wilder_smooth_skips_mid_series_nan():
+    values = np.array([np.nan, 1.0, 2.0, 3.0, np.nan, 7.0])
+    expected = [np.nan, np.nan, 1.5, 2.25, 2.25, 4.625]
+    for kernel in (kernels._wilder_smooth_loop, kernels._wilder_smooth_numpy):
+        np.testing.assert_allclose(kernel(values.reshape(-1, 1), 2)[:, 0], expected, equal_nan=True)
+
+
+def test_1d_and_2d_shapes(staggered_ohlc):
+    high, low, close = staggered_ohlc
+    assert kernels.wilder_smooth(close[:, 0], 14).shape == (close.shape[0],)
+    assert kernels.wilder_smooth(close, 14).shape == close.shape
+    assert kernels.wilder_rsi(close[:, 0]).ndim == 1
+    assert kernels.wilder_rsi(close).shape == close.shape
+    assert kernels.true_range(high[:, 0], low[:, 0], close[:, 0]).ndim == 1
+    assert kernels.parabolic_sar(high[:, 0], low[:, 0]).ndim == 1
+    assert kernels.parabolic_sar(high, low).shape == close.shape
+    for result in kernels.supertrend(high[:, 0], low[:, 0], close[:, 0]):
+        assert result.ndim == 1
+    for result in kernels.supertrend(high, low, close):
+        assert result.shape == close.shape
+
+    # 2차원 입력의 각 열은 같은 열을 1차원으로 계산한 결과와 같음
+    np.testing.assert_allclose(kernels.wilder_rsi(close)[:, 2], kernels.wilder_rsi(close[:, 2]), equal_nan=True)
+    np.testing.assert_allclose(kernels.parabolic_sar(high, low)[:, 3],
+                               kernels.parabolic_sar(high[:, 3], low[:, 3]), equal_nan=True)
+
+
+def test_rejects_3d_input():
+    with pytest.raises(ValueError):
+        kernels.wilder_smooth(np.zeros((2, 2, 2)), 14)
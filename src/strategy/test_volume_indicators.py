@@ -0,0 +1,148 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategy import volume_indicators
+from src.strategy.technical_indicators import TechnicalIndicators
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    """기대값을 손으로 계산할 수 있는 6일치 OHLCV 데이터"""
+    return pd.DataFrame({
+        'Open': [10.0, 10.5, 11.0, 10.5, 12.0, 11.5],
+        'High': [10.5, 11.5, 11.0, 12.5, 12.0, 13.5],
+        'Low': [9.5, 10.5, 10.0, 11.0, 11.0, 12.5],
+        'Close': [10.0, 11.0, 10.5, 12.0, 11.5, 13.0],
+        'Volume': [100, 200, 150, 300, 250, 400],
+    }, index=pd.date_range('2024-01-01', periods=6, freq='D'))
+
+
+def assert_series(actual: pd.Series, expected):
+    np.testing.assert_allclose(actual.to_numpy(dtype=float), np.array(expected, dtype=float),
+                               rtol=1e-9, equal_nan=True)
+
+
+def test_atr(ohlcv):
+    # True Range: [-, 1.5, 1, 2, 1, 2] (첫 행은 전일 종가가 없어 제외), 첫 값은 3일 단순평균
+    indicators = TechnicalIndicators(ohlcv)
+    atr = indicators.get_indicator('ATR', window=3)['ATR_3']
+    assert_series(atr, [np.nan, np.nan, np.nan, 1.5, 4 / 3, 14 / 9])
+
+
+def test_obv(ohlcv):
+    obv = TechnicalIndicators(ohlcv).get_indicator('OBV')['OBV']
+    assert_series(obv, [0, 200, 50, 350, 100, 500])
+
+
+def test_vwap(ohlcv):
+    # 자금 흐름(대표 가격 * 거래량): [1000, 2200, 1575, 3550, 2875, 5200]
+    vwap = TechnicalIndicators(ohlcv).get_indicator('VWAP', window=2)['VWAP_2']
+    assert_series(vwap, [np.nan, 3200 / 300, 3775 / 350, 5125 / 450, 6425 / 550, 8075 / 650])
+
+
+def test_stochastic(ohlcv):
+    stoch = TechnicalIndicators(ohlcv).get_indicator('STOCH', k_window=3, d_window=2)
+    assert_series(stoch['STOCH_K_3_2'], [np.nan, np.nan, 50, 80, 60, 80])
+    assert_series(stoch['STOCH_D_3_2'], [np.nan, np.nan, np.nan, 65, 70, 70])
+
+
+def test_adx(ohlcv):
+    # +DM: [-, 1, 0, 1.5, 0, 1.5], -DM: [-, 0, 0.5, 0, 0, 0], ATR(2): [-, -, 1.25, 1.625, 1.3125, 1.65625]
+    adx = TechnicalIndicators(ohlcv).get_indicator('ADX', window=2)
+    assert_series(adx['PLUS_DI_2'], [np.nan, np.nan, 40, 100 / 1.625, 100 * 0.5 / 1.3125, 100 / 1.65625])
+    assert_series(adx['MINUS_DI_2'], [np.nan, np.nan, 20, 100 * 0.125 / 1.625, 100 * 0.0625 / 1.3125,
+                                      100 * 0.03125 / 1.65625])
+    # DX: [-, -, 100 / 3, 700 / 9, 700 / 9, 3100 / 33]
+    assert_series(adx['ADX_2'], [np.nan, np.nan, np.nan, 500 / 9, 200 / 3, 2650 / 33])
+
+
+def test_adx_warmup_period():
+    # 첫 행을 제외하고 window개 행으로 DI를, 다시 window개 DX로 ADX를 초기화
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(0, 1, size=40))
+    data = pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                         'Volume': np.full(40, 1000)})
+    adx = TechnicalIndicators(data).get_indicator('ADX')
+    assert adx['PLUS_DI'].first_valid_index() == 14
+    assert adx['ADX'].first_valid_index() == 27
+    assert not adx['ADX'].iloc[27:].isna().any()
+
+
+def test_mfi(ohlcv):
+    mfi = TechnicalIndicators(ohlcv).get_indicator('MFI', window=2)['MFI_2']
+    assert_series(mfi, [np.nan, 100, 100 * 2200 / 3775, 100 * 3550 / 5125,
+                        100 * 3550 / 6425, 100 * 5200 / 8075])
+
+
+def test_unknown_indicator_and_parameter(ohlcv):
+    indicators = TechnicalIndicators(ohlcv)
+    with pytest.raises(ValueError):
+        indicators.get_indicator('UNKNOWN')
+    with pytest.raises(ValueError):
+        indicators.get_indicator('ATR', span=3)
+
+
+def test_custom_parameters_do_not_overwrite_default_columns(ohlcv):
+    indicators = TechnicalIndicators(ohlcv)
+    default_atr = indicators.get_indicator('ATR', window=3)
+    other_atr = indicators.get_indicator('ATR', window=2)
+
+    assert 'ATR_3' in indicators.data and 'ATR_2' in indicators.data
+    assert_series(indicators.data['ATR_3'], default_atr['ATR_3'])
+    assert_series(indicators.data['ATR_2'], other_atr['ATR_2'])
+    assert not np.allclose(indicators.data['ATR_3'].iloc[3:], indicators.data['ATR_2'].iloc[3:])
+
+
+def test_different_parameters_with_same_value_use_different_columns(ohlcv):
+    indicators = TechnicalIndicators(ohlcv)
+    by_k = indicators.get_indicator('STOCH', k_window=2)
+    by_d = indicators.get_indicator('STOCH', d_window=2)
+
+    assert list(by_k.columns) == ['STOCH_K_2_3', 'STOCH_D_2_3']
+    assert list(by_d.columns) == ['STOCH_K_14_2', 'STOCH_D_14_2']
+    assert_series(indicators.data['STOCH_K_2_3'], by_k['STOCH_K_2_3'])
+    assert_series(indicators.data['STOCH_K_14_2'], by_d['STOCH_K_14_2'])
+
+    by_window = indicators.get_indicator('SUPERTREND', window=2)
+    by_multiplier = indicators.get_indicator('SUPERTREND', multiplier=2)
+    assert set(by_window.columns).isdisjoint(by_multiplier.columns)
+    assert_series(indicators.data[by_window.columns[0]], by_window.iloc[:, 0])
+
+
+def test_empty_frame(ohlcv):
+    indicators = TechnicalIndicators(ohlcv.iloc[:0])
+    indicators.calculate_volume_indicators()
+    for name in volume_indicators.INDICATOR_REGISTRY:
+        assert indicators.get_indicator(name).empty
+
+
+def test_default_parameters_share_cache_entry(ohlcv):
+    indicators = TechnicalIndicators(ohlcv)
+    default_atr = indicators.get_indicator('ATR')
+    assert indicators.get_indicator('ATR', window=14) is default_atr
+    assert list(default_atr.columns) == ['ATR']
+    assert 'ATR_14' not in indicators.data
+
+
+def test_shared_intermediates_are_reused(ohlcv, monkeypatch):
+    calls = []
+    true_range = volume_indicators.kernels.true_range
+
+    def counting_true_range(*args):
+        calls.append(args)
+        return true_range(*args)
+
+    monkeypatch.setattr(volume_indicators.kernels, 'true_range', counting_true_range)
+    indicators = TechnicalIndicators(ohlcv)
+    indicators.get_indicator('ATR', window=3)
+    atr = indicators._intermediates['atr_3']
+    indicators.get_indicator('ADX', window=3)
+    indicators.get_indicator('SUPERTREND', window=3)
+
+    assert len(calls) == 1
+    assert indicators._intermediates['atr_3'] is atr
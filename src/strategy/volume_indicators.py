@@ -0,0 +1,290 @@
+"""
+거래량/가격 범위 기반 기술적 지표 모듈
+
+이 모듈은 종가만 사용하는 기존 지표와 달리 OHLCV 데이터의 고가(High), 저가(Low),
+거래량(Volume)을 활용하는 지표를 플러그인 형태로 제공합니다.
+주요 지표:
+1. ATR (Average True Range, 평균 실제 범위)
+2. OBV (On Balance Volume, 누적 거래량)
+3. VWAP (Volume Weighted Average Price, 거래량 가중 평균 가격)
+4. 스토캐스틱 (Stochastic Oscillator)
+5. ADX (Average Directional Index, 평균 방향성 지수)
+6. MFI (Money Flow Index, 자금 흐름 지수)
+7. Parabolic SAR
+8. SuperTrend
+
+플러그인 구조:
+- 각 지표 함수는 @register_indicator 데코레이터로 INDICATOR_REGISTRY에 등록됩니다.
+- 지표 함수의 형식: func(data, cache, **params) -> Dict[str, pd.Series]
+  * data: OHLCV 데이터프레임
+  * cache: 지표 간에 공유되는 중간 계산 결과 (True Range, 전일 종가, 대표 가격 등)
+  * 반환값: 컬럼 이름과 지표값(Series)의 딕셔너리
+- 모든 계산은 NumPy 배열 연산과 pandas rolling 커널로 벡터화되어 있으며,
+  Wilder 평활, Parabolic SAR, SuperTrend 같은 재귀형 계산은 kernels 모듈의 컴파일 커널을 사용합니다.
+- 새 지표를 추가하려면 같은 형식의 함수를 작성하고 데코레이터로 등록하면 됩니다.
+
+각 지표에 대한 상세 설명:
+
+1. ATR (Average True Range)
+   - True Range: max(고가 - 저가, |고가 - 전일 종가|, |저가 - 전일 종가|)
+   - True Range를 Wilder 방식(첫 값은 단순평균, 이후 alpha = 1/기간)으로 평활한 값
+   - 첫 행은 전일 종가가 없으므로 제외하고 둘째 행부터 평활 (첫 ATR은 기간 + 1번째 행)
+   - 변동성 지표로 손절폭, 포지션 크기 결정에 활용
+   - 기본 기간: 14일
+
+2. OBV (On Balance Volume)
+   - 종가 상승일에는 거래량을 더하고, 하락일에는 거래량을 빼서 누적
+   - 가격보다 거래량이 먼저 움직인다는 가정에 기반
+   - OBV 상승 + 가격 횡보: 매집 가능성
+
+3. VWAP (Volume Weighted Average Price)
+   - 대표 가격((고가 + 저가 + 종가) / 3)을 거래량으로 가중 평균한 값
+   - 일봉 데이터이므로 누적이 아닌 이동 기간(기본 20일) 기준으로 계산
+   - 가격 > VWAP: 강세, 가격 < VWAP: 약세
+
+4. 스토캐스틱 (Stochastic Oscillator)
+   - %K: (종가 - 기간 최저가) / (기간 최고가 - 기간 최저가) * 100
+   - %D: %K의 3일 이동평균
+   - 80 이상: 과매수, 20 이하: 과매도
+   - 기본 기간: 14일
+
+5. ADX (Average Directional Index)
+   - +DM/-DM(방향성 움직임)을 ATR로 나누어 +DI/-DI 계산
+   - DX: |+DI - -DI| / (+DI + -DI) * 100, ADX는 DX의 Wilder 평활값
+   - 25 이상: 추세 존재, 20 이하: 추세 없음(횡보)
+   - 기본 기간: 14일
+
+6. MFI (Money Flow Index)
+   - 거래량을 반영한 RSI
+   - 대표 가격 상승일의 자금 흐름(대표 가격 * 거래량)과 하락일의 자금 흐름 비율로 계산
+   - 80 이상: 과매수, 20 이하: 과매도
+   - 기본 기간: 14일
+
+7. Parabolic SAR
+   - 추세 방향으로 가속 계수(0.02씩 증가, 최대 0.2)만큼 극점에 다가가는 추적 손절 지표
+   - 가격이 SAR을 돌파하면 추세 반전
+   - 가격 > SAR: 상승 추세, 가격 < SAR: 하락 추세
+
+8. SuperTrend
+   - (고가 + 저가) / 2 ± 승수 * ATR로 상하단 밴드를 만들고, 종가의 밴드 돌파로 추세 판단
+   - 상승 추세에서는 하단 밴드, 하락 추세에서는 상단 밴드가 지표값
+   - 기본값: 10일 ATR, 승수 3
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Callable, Dict
+
+from src.strategy import kernels
+
+# 등록된 지표 플러그인 (지표 이름 -> 계산 함수)
+INDICATOR_REGISTRY: Dict[str, Callable[..., Dict[str, pd.Series]]] = {}
+
+
+def register_indicator(name: str):
+    """
+    지표 플러그인 등록 데코레이터
+
+    Args:
+        name (str): 지표 이름 (TechnicalIndicators.get_indicator에서 사용)
+    """
+    def decorator(func: Callable[..., Dict[str, pd.Series]]):
+        INDICATOR_REGISTRY[name] = func
+        return func
+    return decorator
+
+
+def _wilder_smooth(values: pd.Series, window: int) -> pd.Series:
+    """Wilder 평활 (kernels.wilder_smooth 사용)"""
+    return pd.Series(kernels.wilder_smooth(values.to_numpy(dtype=float), window), index=values.index)
+
+
+def _get_prev_close(data: pd.DataFrame, cache: Dict) -> np.ndarray:
+    """전일 종가 (공유 중간값)"""
+    if 'prev_close' not in cache:
+        close = data['Close'].to_numpy(dtype=float)
+        prev_close = np.empty_like(close)
+        prev_close[:1] = np.nan
+        prev_close[1:] = close[:-1]
+        cache['prev_close'] = prev_close
+    return cache['prev_close']
+
+
+def _get_true_range(data: pd.DataFrame, cache: Dict) -> np.ndarray:
+    """True Range (공유 중간값)"""
+    if 'true_range' not in cache:
+        true_range = kernels.true_range(data['High'].to_numpy(dtype=float),
+                                        data['Low'].to_numpy(dtype=float),
+                                        data['Close'].to_numpy(dtype=float))
+        # 첫 행은 전일 종가가 없어 True Range를 정의할 수 없으므로 NaN으로 두어
+        # Wilder 평활이 둘째 행부터 window개 값으로 초기값을 계산하도록 함
+        true_range[:1] = np.nan
+        cache['true_range'] = true_range
+    return cache['true_range']
+
+
+def _get_typical_price(data: pd.DataFrame, cache: Dict) -> np.ndarray:
+    """대표 가격 (고가 + 저가 + 종가) / 3 (공유 중간값)"""
+    if 'typical_price' not in cache:
+        cache['typical_price'] = (data['High'].to_numpy(dtype=float)
+                                  + data['Low'].to_numpy(dtype=float)
+                                  + data['Close'].to_numpy(dtype=float)) / 3.0
+    return cache['typical_price']
+
+
+def _get_money_flow(data: pd.DataFrame, cache: Dict) -> np.ndarray:
+    """자금 흐름 = 대표 가격 * 거래량 (공유 중간값)"""
+    if 'money_flow' not in cache:
+        cache['money_flow'] = _get_typical_price(data, cache) * data['Volume'].to_numpy(dtype=float)
+    return cache['money_flow']
+
+
+def _get_atr(data: pd.DataFrame, cache: Dict, window: int) -> pd.Series:
+    """기간별 ATR (ATR, ADX에서 공유)"""
+    key = f'atr_{window}'
+    if key not in cache:
+        true_range = pd.Series(_get_true_range(data, cache), index=data.index)
+        cache[key] = _wilder_smooth(true_range, window)
+    return cache[key]
+
+
+@register_indicator('ATR')
+def calculate_atr(data: pd.DataFrame, cache: Dict, window: int = 14) -> Dict[str, pd.Series]:
+    """
+    ATR(Average True Range) 계산
+
+    Args:
+        window (int): ATR 계산 기간
+    """
+    return {'ATR': _get_atr(data, cache, window)}
+
+
+@register_indicator('OBV')
+def calculate_obv(data: pd.DataFrame, cache: Dict) -> Dict[str, pd.Series]:
+    """OBV(On Balance Volume) 계산"""
+    close = data['Close'].to_numpy(dtype=float)
+    volume = data['Volume'].to_numpy(dtype=float)
+    direction = np.sign(close - _get_prev_close(data, cache))
+    direction[:1] = 0
+    return {'OBV': pd.Series(np.cumsum(direction * volume), index=data.index)}
+
+
+@register_indicator('VWAP')
+def calculate_vwap(data: pd.DataFrame, cache: Dict, window: int = 20) -> Dict[str, pd.Series]:
+    """
+    VWAP(Volume Weighted Average Price) 계산
+
+    Args:
+        window (int): VWAP 계산 기간
+    """
+    money_flow = pd.Series(_get_money_flow(data, cache), index=data.index)
+    volume = data['Volume'].astype(float)
+    vwap = money_flow.rolling(window=window).sum() / volume.rolling(window=window).sum()
+    return {'VWAP': vwap.replace([np.inf, -np.inf], np.nan)}
+
+
+@register_indicator('STOCH')
+def calculate_stochastic(data: pd.DataFrame, cache: Dict,
+                         k_window: int = 14, d_window: int = 3) -> Dict[str, pd.Series]:
+    """
+    스토캐스틱(Stochastic Oscillator) 계산
+
+    Args:
+        k_window (int): %K 계산 기간
+        d_window (int): %D 이동평균 기간
+    """
+    lowest_low = data['Low'].rolling(window=k_window).min()
+    highest_high = data['High'].rolling(window=k_window).max()
+    price_range = (highest_high - lowest_low).replace(0, np.nan)
+    stoch_k = (data['Close'] - lowest_low) / price_range * 100
+    stoch_d = stoch_k.rolling(window=d_window).mean()
+    return {'STOCH_K': stoch_k, 'STOCH_D': stoch_d}
+
+
+@register_indicator('ADX')
+def calculate_adx(data: pd.DataFrame, cache: Dict, window: int = 14) -> Dict[str, pd.Series]:
+    """
+    ADX(Average Directional Index) 계산
+
+    Args:
+        window (int): ADX 계산 기간
+    """
+    high = data['High'].to_numpy(dtype=float)
+    low = data['Low'].to_numpy(dtype=float)
+    up_move = np.empty_like(high)
+    down_move = np.empty_like(low)
+    up_move[1:] = high[1:] - high[:-1]
+    down_move[1:] = low[:-1] - low[1:]
+
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    # 첫 행은 True Range와 마찬가지로 방향성 움직임을 정의할 수 없으므로 NaN
+    plus_dm[:1] = minus_dm[:1] = np.nan
+
+    atr = _get_atr(data, cache, window).replace(0, np.nan)
+    plus_di = _wilder_smooth(pd.Series(plus_dm, index=data.index), window) / atr * 100
+    minus_di = _wilder_smooth(pd.Series(minus_dm, index=data.index), window) / atr * 100
+
+    di_sum = (plus_di + minus_di).replace(0, np.nan)
+    dx = (plus_di - minus_di).abs() / di_sum * 100
+    # DX가 NaN인 시점은 Wilder 평활에서 건너뛰고 직전 ADX를 유지
+    adx = _wilder_smooth(dx, window)
+    return {'ADX': adx, 'PLUS_DI': plus_di, 'MINUS_DI': minus_di}
+
+
+@register_indicator('MFI')
+def calculate_mfi(data: pd.DataFrame, cache: Dict, window: int = 14) -> Dict[str, pd.Series]:
+    """
+    MFI(Money Flow Index) 계산
+
+    Args:
+        window (int): MFI 계산 기간
+    """
+    typical_price = _get_typical_price(data, cache)
+    money_flow = _get_money_flow(data, cache)
+    price_change = np.empty_like(typical_price)
+    price_change[:1] = 0.0
+    price_change[1:] = typical_price[1:] - typical_price[:-1]
+
+    positive_flow = pd.Series(np.where(price_change > 0, money_flow, 0.0), index=data.index)
+    negative_flow = pd.Series(np.where(price_change < 0, money_flow, 0.0), index=data.index)
+    positive_sum = positive_flow.rolling(window=window).sum()
+    negative_sum = negative_flow.rolling(window=window).sum()
+
+    mfi = 100 * positive_sum / (positive_sum + negative_sum).replace(0, np.nan)
+    return {'MFI': mfi}
+
+
+@register_indicator('PSAR')
+def calculate_parabolic_sar(data: pd.DataFrame, cache: Dict,
+                            step: float = 0.02, max_step: float = 0.2) -> Dict[str, pd.Series]:
+    """
+    Parabolic SAR 계산
+
+    Args:
+        step (float): 가속 계수 증가폭
+        max_step (float): 가속 계수 최대값
+    """
+    sar = kernels.parabolic_sar(data['High'].to_numpy(dtype=float),
+                                data['Low'].to_numpy(dtype=float),
+                                step=step, max_step=max_step)
+    return {'PSAR': pd.Series(sar, index=data.index)}
+
+
+@register_indicator('SUPERTREND')
+def calculate_supertrend(data: pd.DataFrame, cache: Dict,
+                         window: int = 10, multiplier: float = 3.0) -> Dict[str, pd.Series]:
+    """
+    SuperTrend 계산
+
+    Args:
+        window (int): ATR 계산 기간
+        multiplier (float): ATR 승수
+    """
+    trend, direction = kernels.supertrend(data['High'].to_numpy(dtype=float),
+                                          data['Low'].to_numpy(dtype=float),
+                                          data['Close'].to_numpy(dtype=float),
+                                          window=window, multiplier=multiplier,
+                                          atr=_get_atr(data, cache, window).to_numpy())
+    return {'SUPERTREND': pd.Series(trend, index=data.index),
+            'SUPERTREND_direction': pd.Series(direction, index=data.index)}
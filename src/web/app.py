@@ -10,14 +10,25 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from flask import Flask, render_template, jsonify
 from src.data.data_collector import StockDataCollector
+from src.monitoring.alert_engine import SignalAlertEngine, latest_signals
+from src.strategy.technical_indicators import TechnicalIndicators
+from src.web.snapshots import SnapshotStore
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import json
+import logging
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# build_stock_payload의 응답 형식이 바뀌면 값을 올려서 저장된 스냅샷을 모두 다시 생성하도록 함
+PAYLOAD_VERSION = 1
+
 app = Flask(__name__)
 collector = StockDataCollector()
+alert_engine = SignalAlertEngine()
+snapshot_store = SnapshotStore()
 
 def create_stock_chart(symbol: str, df: pd.DataFrame) -> dict:
     """주식 차트 생성"""
@@ -84,48 +95,119 @@ def index():
     """메인 페이지"""
     return render_template('index.html', symbols=collector.symbols)
 
+def build_stock_payload(symbol: str, indicators: TechnicalIndicators) -> dict:
+    """주식 데이터 API 응답 생성"""
+    # 차트 데이터 생성
+    chart_data = create_stock_chart(symbol, indicators.data)
+    
+    # 종목 정보 가져오기
+    info = collector.get_symbol_info(symbol)
+    
+    # 최신 가격 정보
+    latest = indicators.data.iloc[-1]
+    price_info = {
+        'close': latest['Close'],
+        'change': latest['Close'] - indicators.data.iloc[-2]['Close'],
+        'change_percent': ((latest['Close'] - indicators.data.iloc[-2]['Close']) / indicators.data.iloc[-2]['Close']) * 100,
+        'volume': latest['Volume']
+    }
+    
+    # 기술적 지표 요약
+    summary = indicators.get_summary()
+    
+    # 매매 신호
+    signals = latest_signals(indicators)
+    
+    return {
+        'chart': chart_data,
+        'info': info,
+        'price': price_info,
+        'indicators': summary,
+        'signals': signals
+    }
+
+def get_snapshot_version(symbol: str):
+    """
+    스냅샷 유효성 판단 기준 (응답 형식 버전 + 데이터 파일 버전)
+    
+    Returns:
+        버전 정보 (데이터 파일이 없으면 None)
+    """
+    data_version = collector.get_data_version(symbol)
+    if data_version is None:
+        return None
+    return {
+        'version': f"v{PAYLOAD_VERSION}:{data_version['version']}",
+        'modified': data_version['modified']
+    }
+
+def save_snapshot(symbol: str, payload: dict):
+    """
+    종목 응답을 스냅샷으로 저장
+    
+    Returns:
+        스냅샷 메타데이터 (저장하지 않았으면 None)
+    """
+    # 종목 정보 조회에 실패한 응답은 저장하지 않음 (다음 데이터 갱신까지 빈 정보가 전송되지 않도록 함)
+    if not payload['info']:
+        logger.warning(f"Symbol info for {symbol} is empty, snapshot not saved")
+        return None
+    # get_latest_data가 데이터 파일을 저장한 뒤의 버전 사용
+    snapshot_version = get_snapshot_version(symbol)
+    if snapshot_version is None:
+        return None
+    return snapshot_store.save(symbol, payload, snapshot_version)
+
+def refresh_snapshots() -> pd.DataFrame:
+    """
+    모든 종목의 응답 스냅샷 사전 렌더링 (데이터 갱신 후 실행)
+    종목별 지표 계산 결과를 스냅샷과 매매 신호 행렬에 함께 사용합니다.
+    
+    Returns:
+        pd.DataFrame: 종목(행) x 지표(열) 최신 매매 신호 행렬
+    """
+    signal_rows = {}
+    for symbol in collector.symbols:
+        try:
+            df = collector.get_latest_data(symbol)
+            if df.empty:
+                logger.warning(f"No data available for {symbol}, snapshot not rendered")
+                continue
+            payload = build_stock_payload(symbol, TechnicalIndicators(df))
+            save_snapshot(symbol, payload)
+            signal_rows[symbol] = payload['signals']
+        except Exception as e:
+            logger.error(f"Error rendering snapshot for {symbol}: {str(e)}")
+    return pd.DataFrame.from_dict(signal_rows, orient='index')
+
 @app.route('/api/stock/<symbol>')
 def get_stock_data(symbol):
     """주식 데이터 API"""
     try:
+        # 수집 대상 종목은 응답 형식과 데이터 버전이 같으면 저장된 스냅샷을 그대로 전송
+        if symbol in collector.symbols:
+            snapshot_version = get_snapshot_version(symbol)
+            meta = snapshot_store.get_meta(symbol)
+            if snapshot_version is not None and meta is not None and meta['data_version'] == snapshot_version['version']:
+                response = snapshot_store.send(symbol, meta)
+                if response is not None:
+                    return response
+        
         # 데이터 가져오기
         df = collector.get_latest_data(symbol)
         if df.empty:
             return jsonify({'error': 'No data available'}), 404
-
-        # 기술적 지표 계산
-        from src.strategy.technical_indicators import TechnicalIndicators
-        indicators = TechnicalIndicators(df)
-        
-        # 차트 데이터 생성
-        chart_data = create_stock_chart(symbol, indicators.data)
-        
-        # 종목 정보 가져오기
-        info = collector.get_symbol_info(symbol)
-        
-        # 최신 가격 정보
-        latest = indicators.data.iloc[-1]
-        price_info = {
-            'close': latest['Close'],
-            'change': latest['Close'] - indicators.data.iloc[-2]['Close'],
-            'change_percent': ((latest['Close'] - indicators.data.iloc[-2]['Close']) / indicators.data.iloc[-2]['Close']) * 100,
-            'volume': latest['Volume']
-        }
-        
-        # 기술적 지표 요약
-        summary = indicators.get_summary()
         
-        # 매매 신호
-        signals = indicators.get_signals()
-        latest_signals = {k: v.iloc[-1] for k, v in signals.items()}
+        payload = build_stock_payload(symbol, TechnicalIndicators(df))
         
-        return jsonify({
-            'chart': chart_data,
-            'info': info,
-            'price': price_info,
-            'indicators': summary,
-            'signals': latest_signals
-        })
+        # 수집 대상이 아닌 종목은 스냅샷을 저장하지 않고 그대로 응답
+        if symbol in collector.symbols:
+            meta = save_snapshot(symbol, payload)
+            if meta is not None:
+                response = snapshot_store.send(symbol, meta)
+                if response is not None:
+                    return response
+        return jsonify(payload)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -135,7 +217,11 @@ def update_all_data():
     """모든 종목 데이터 업데이트"""
     try:
         collector.collect_all_data()
-        return jsonify({'message': 'Data updated successfully'})
+        # 갱신된 데이터로 종목별 응답 스냅샷 사전 렌더링
+        signal_matrix = refresh_snapshots()
+        # 데이터 갱신 후 매매 신호 변경 알림
+        alerts = alert_engine.process(signal_matrix)
+        return jsonify({'message': 'Data updated successfully', 'alerts': len(alerts)})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -0,0 +1,171 @@
+"""
+대시보드 API 응답 스냅샷 저장소
+
+이 모듈은 종목별 /api/stock/<symbol> 응답을 미리 렌더링하여 압축된 파일로 저장하고,
+요청 시 파일을 그대로 전송합니다.
+주요 기능:
+1. 응답 본문을 원본(JSON), gzip, brotli(설치된 경우) 형식으로 저장
+2. 데이터 버전(응답 형식 버전 + 로컬 데이터 파일의 이름/수정 시각/크기), ETag, 저장된 압축 형식을 메타데이터로 저장
+3. 저장된 압축 형식 중 Accept-Encoding에 맞는 형식을 선택하여 전송
+4. ETag/Last-Modified 기반 조건부 요청(If-None-Match, If-Modified-Since)에 304 응답
+5. 본문 파일이 없으면 전송하지 않고 호출자가 스냅샷을 다시 생성하도록 함
+
+저장 경로 (data/snapshots/):
+- <symbol>.json, <symbol>.json.gz, <symbol>.json.br: 응답 본문
+- <symbol>.meta.json: 데이터 버전, ETag, 수정 시각, 저장된 압축 형식
+
+brotli 설치 (선택 사항):
+    pip install brotli
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from typing import Dict, Optional
+
+from flask import Response, request, send_file
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 압축 형식별 파일 확장자 (선호 순서)
+ENCODING_SUFFIXES = {'br': '.json.br', 'gzip': '.json.gz', 'identity': '.json'}
+
+
+def _json_default(value):
+    """numpy 스칼라 등 json 모듈이 직렬화하지 못하는 값 변환"""
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class SnapshotStore:
+    def __init__(self, snapshot_dir: Optional[str] = None):
+        """
+        응답 스냅샷 저장소
+
+        Args:
+            snapshot_dir (Optional[str]): 스냅샷 저장 디렉토리 (기본값: data/snapshots)
+        """
+        if snapshot_dir is None:
+            snapshot_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'snapshots')
+        self.snapshot_dir = snapshot_dir
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+
+        # 메타데이터 캐시 (요청마다 메타 파일을 다시 읽지 않도록 함)
+        self.meta_cache: Dict[str, Dict] = {}
+
+    def _path(self, symbol: str, suffix: str) -> str:
+        return os.path.join(self.snapshot_dir, f"{symbol}{suffix}")
+
+    def _write(self, path: str, content: bytes):
+        """
+        임시 파일에 쓴 후 교체 (전송 중인 파일이 깨지지 않도록 함)
+        여러 요청 스레드가 같은 종목을 동시에 저장할 수 있으므로 임시 파일 이름은 매번 새로 생성합니다.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.snapshot_dir, prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get_meta(self, symbol: str) -> Optional[Dict]:
+        """
+        스냅샷 메타데이터 조회
+
+        Args:
+            symbol (str): 주식 심볼
+
+        Returns:
+            Optional[Dict]: 메타데이터 (data_version, etag, modified, encodings), 스냅샷이 없으면 None
+        """
+        if symbol in self.meta_cache:
+            return self.meta_cache[symbol]
+        meta_path = self._path(symbol, '.meta.json')
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading snapshot meta for {symbol}: {str(e)}")
+            return None
+        self.meta_cache[symbol] = meta
+        return meta
+
+    def save(self, symbol: str, payload: Dict, data_version: Dict) -> Dict:
+        """
+        응답 스냅샷 저장
+
+        Args:
+            symbol (str): 주식 심볼
+            payload (Dict): 응답 본문
+            data_version (Dict): 스냅샷 버전(version)과 데이터 수정 시각(modified)
+
+        Returns:
+            Dict: 저장된 스냅샷 메타데이터
+        """
+        body = json.dumps(payload, default=_json_default).encode('utf-8')
+        self._write(self._path(symbol, ENCODING_SUFFIXES['identity']), body)
+        self._write(self._path(symbol, ENCODING_SUFFIXES['gzip']), gzip.compress(body, compresslevel=9))
+        encodings = ['gzip', 'identity']
+        if brotli is not None:
+            self._write(self._path(symbol, ENCODING_SUFFIXES['br']), brotli.compress(body, quality=11))
+            encodings.insert(0, 'br')
+
+        meta = {
+            'data_version': data_version['version'],
+            'etag': hashlib.sha1(body).hexdigest()[:20],
+            'modified': data_version['modified'].isoformat(),
+            'encodings': encodings
+        }
+        # 메타데이터는 본문 파일을 모두 저장한 뒤 마지막에 기록
+        self._write(self._path(symbol, '.meta.json'), json.dumps(meta).encode('utf-8'))
+        self.meta_cache[symbol] = meta
+        return meta
+
+    def send(self, symbol: str, meta: Dict) -> Optional[Response]:
+        """
+        스냅샷 전송 (조건부 요청 시 304 응답)
+
+        Args:
+            symbol (str): 주식 심볼
+            meta (Dict): 스냅샷 메타데이터
+
+        Returns:
+            Optional[Response]: 압축된 응답 또는 304 응답, 본문 파일이 없으면 None (스냅샷을 다시 생성해야 함)
+        """
+        # 이 스냅샷을 저장할 때 실제로 기록한 압축 형식 중에서만 선택
+        encodings = meta.get('encodings', ['gzip', 'identity'])
+        encoding = request.accept_encodings.best_match(encodings) or 'identity'
+        try:
+            response = send_file(
+                self._path(symbol, ENCODING_SUFFIXES[encoding]),
+                mimetype='application/json',
+                etag=f"{meta['etag']}-{encoding}",
+                last_modified=datetime.fromisoformat(meta['modified']),
+                conditional=True
+            )
+        except FileNotFoundError:
+            # 메타데이터만 남고 본문 파일이 삭제된 경우 오래된 스냅샷으로 취급
+            logger.warning(f"Snapshot body for {symbol} ({encoding}) is missing, re-rendering")
+            self.meta_cache.pop(symbol, None)
+            return None
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+        # 브라우저가 매번 ETag로 재검증하도록 설정
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
@@ -0,0 +1,179 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.monitoring.alert_engine import SignalAlertEngine
+from src.monitoring.notifiers import FileAlertSink
+from src.web import app as app_module
+from src.web import snapshots
+from src.web.snapshots import SnapshotStore
+
+SYMBOLS = {'NVDA': 'NVIDIA (AI 반도체)', 'AMD': 'AMD (반도체)'}
+
+
+class FakeBrotli:
+    """brotli 설치 여부와 무관하게 br 경로를 확인하기 위한 대체 모듈"""
+
+    @staticmethod
+    def compress(body: bytes, quality: int = 11) -> bytes:
+        return b'br:' + body
+
+
+def write_market_data(collector, symbol: str, n_days: int = 150, mtime: float = 1_700_000_000):
+    rng = np.random.default_rng(len(symbol) + n_days)
+    close = 100 + np.cumsum(rng.normal(0, 1, size=n_days))
+    df = pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': rng.integers(1_000, 10_000, size=n_days),
+    }, index=pd.date_range('2024-01-01', periods=n_days, freq='D'))
+    path = collector.get_data_path(symbol)
+    df.to_csv(path)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    collector = app_module.collector
+    monkeypatch.setattr(collector, 'data_dir', str(tmp_path / 'market_data'))
+    monkeypatch.setattr(collector, 'symbols', dict(SYMBOLS))
+    monkeypatch.setattr(collector, 'info_cache', {s: {'name': s} for s in list(SYMBOLS) + ['ZZZZ']})
+    os.makedirs(collector.data_dir)
+    for symbol in list(SYMBOLS) + ['ZZZZ']:
+        write_market_data(collector, symbol)
+
+    monkeypatch.setattr(app_module, 'snapshot_store', SnapshotStore(str(tmp_path / 'snapshots')))
+    monkeypatch.setattr(app_module, 'alert_engine', SignalAlertEngine(
+        alert_dir=str(tmp_path / 'alerts'), sink=FileAlertSink(str(tmp_path / 'alerts' / 'alerts.jsonl'))))
+    monkeypatch.setattr(snapshots, 'brotli', None)
+    return app_module.app.test_client()
+
+
+def test_snapshot_response_headers_and_body(client):
+    response = client.get('/api/stock/NVDA', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert response.headers['Cache-Control'] == 'no-cache'
+    assert response.headers['ETag']
+    assert response.headers['Last-Modified']
+    payload = json.loads(gzip.decompress(response.data))
+    assert set(payload) == {'chart', 'info', 'price', 'indicators', 'signals'}
+
+
+def test_identity_when_no_compression_accepted(client):
+    response = client.get('/api/stock/NVDA')
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+    assert json.loads(response.data)['info'] == {'name': 'NVDA'}
+
+
+def test_conditional_requests_return_304(client):
+    first = client.get('/api/stock/NVDA', headers={'Accept-Encoding': 'gzip'})
+
+    by_etag = client.get('/api/stock/NVDA', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']})
+    assert by_etag.status_code == 304
+    assert by_etag.data == b''
+
+    by_date = client.get('/api/stock/NVDA', headers={
+        'Accept-Encoding': 'gzip', 'If-Modified-Since': first.headers['Last-Modified']})
+    assert by_date.status_code == 304
+
+    # 다른 압축 형식의 ETag로는 304가 되지 않음
+    other = client.get('/api/stock/NVDA', headers={'If-None-Match': first.headers['ETag']})
+    assert other.status_code == 200
+
+
+def test_encoding_negotiated_among_stored_encodings(client, monkeypatch):
+    # brotli 없이 저장된 스냅샷은 br 요청에도 gzip으로 응답
+    response = client.get('/api/stock/NVDA', headers={'Accept-Encoding': 'br, gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert app_module.snapshot_store.get_meta('NVDA')['encodings'] == ['gzip', 'identity']
+
+    # brotli가 설치된 뒤 저장한 스냅샷은 br로 응답
+    monkeypatch.setattr(snapshots, 'brotli', FakeBrotli)
+    app_module.refresh_snapshots()
+    response = client.get('/api/stock/NVDA', headers={'Accept-Encoding': 'br, gzip'})
+    assert response.headers['Content-Encoding'] == 'br'
+    assert response.data.startswith(b'br:')
+
+
+def test_rerender_when_data_version_changes(client):
+    first = client.get('/api/stock/NVDA', headers={'Accept-Encoding': 'gzip'})
+    write_market_data(app_module.collector, 'NVDA', n_days=151, mtime=1_700_086_400)
+
+    second = client.get('/api/stock/NVDA', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.headers['ETag'] != first.headers['ETag']
+    assert second.headers['Last-Modified'] != first.headers['Last-Modified']
+
+
+def test_unknown_symbol_is_not_persisted(client, tmp_path):
+    response = client.get('/api/stock/ZZZZ')
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+    assert not any(name.startswith('ZZZZ') for name in os.listdir(tmp_path / 'snapshots'))
+
+
+def test_update_all_computes_indicators_once_per_symbol(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(app_module.collector, 'collect_all_data', lambda: None)
+    created = []
+    original = app_module.TechnicalIndicators
+
+    def counting_indicators(df):
+        created.append(df)
+        return original(df)
+
+    monkeypatch.setattr(app_module, 'TechnicalIndicators', counting_indicators)
+    response = client.get('/api/update_all')
+
+    assert response.status_code == 200
+    assert len(created) == len(SYMBOLS)
+    for symbol in SYMBOLS:
+        assert app_module.snapshot_store.get_meta(symbol) is not None
+    assert set(app_module.alert_engine.load_state().index) == set(SYMBOLS)
+
+
+def test_rerender_when_payload_version_changes(client, monkeypatch):
+    first = client.get('/api/stock/NVDA', headers={'Accept-Encoding': 'gzip'})
+    old_version = app_module.snapshot_store.get_meta('NVDA')['data_version']
+
+    monkeypatch.setattr(app_module, 'PAYLOAD_VERSION', app_module.PAYLOAD_VERSION + 1)
+    monkeypatch.setattr(app_module, 'build_stock_payload',
+                        lambda symbol, indicators: {'info': {'name': symbol}, 'signals': {}, 'schema': 'new'})
+    second = client.get('/api/stock/NVDA', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']})
+
+    assert second.status_code == 200
+    assert json.loads(gzip.decompress(second.data))['schema'] == 'new'
+    assert app_module.snapshot_store.get_meta('NVDA')['data_version'] != old_version
+
+
+def test_empty_symbol_info_is_not_persisted(client):
+    app_module.collector.info_cache['NVDA'] = {}
+    response = client.get('/api/stock/NVDA')
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+    assert app_module.snapshot_store.get_meta('NVDA') is None
+
+    # 종목 정보를 다시 가져온 뒤에는 스냅샷 저장
+    app_module.collector.info_cache['NVDA'] = {'name': 'NVDA'}
+    assert 'ETag' in client.get('/api/stock/NVDA').headers
+
+
+def test_missing_snapshot_body_is_rerendered(client, tmp_path):
+    client.get('/api/stock/NVDA', headers={'Accept-Encoding': 'gzip'})
+    os.remove(tmp_path / 'snapshots' / 'NVDA.json.gz')
+
+    response = client.get('/api/stock/NVDA', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert json.loads(gzip.decompress(response.data))['info'] == {'name': 'NVDA'}
+    assert os.path.exists(tmp_path / 'snapshots' / 'NVDA.json.gz')